@@ -0,0 +1,49 @@
+import importlib.util
+import random
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+MAIN_PATH = Path(__file__).resolve().parent.parent / "data" / "Main.py"
+spec = importlib.util.spec_from_file_location("Main", MAIN_PATH)
+Main = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(Main)
+
+
+def expected_undervalued(prices, threshold_percentile):
+    """Reference result using pandas' linear-interpolated quantile."""
+    series = pd.Series(prices, dtype=float)
+    threshold = series.quantile(threshold_percentile / 100)
+    mean = series.mean()
+    return sorted((mean - p) * 100.0 / mean for p in prices if p < threshold)[::-1]
+
+
+@pytest.mark.parametrize("threshold_percentile", [10, 25, 50, 90])
+def test_get_undervalued_matches_pandas_quantile(tmp_path, threshold_percentile):
+    rng = random.Random(threshold_percentile)
+    for n in range(1, 101):
+        db = Main.DatabaseManager(str(tmp_path / f"assets_{n}.db"))
+        # Mix distinct and repeated prices so ties hit the interpolation
+        prices = [float(rng.choice([rng.randint(1, 20), rng.uniform(1, 1000)]))
+                  for _ in range(n)]
+        assert db.insert_assets(
+            (f"title {i}", price, f"link {i}") for i, price in enumerate(prices)
+        ) == n
+
+        undervalued = db.get_undervalued(threshold_percentile, limit=n)
+        expected = expected_undervalued(prices, threshold_percentile)
+
+        assert len(undervalued) == len(expected), n
+        assert undervalued["discount_percent"].tolist() == pytest.approx(expected)
+
+        df = db.get_all_assets()
+        analyzed = Main.AssetAnalyzer.identify_undervalued_assets(df, threshold_percentile)
+        assert len(analyzed) == len(expected), n
+        db.close()
+
+
+def test_get_undervalued_empty_table(tmp_path):
+    db = Main.DatabaseManager(str(tmp_path / "assets.db"))
+    assert db.get_undervalued().empty
+    db.close()